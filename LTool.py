@@ -11,29 +11,211 @@ Date: 2025
 
 import os
 import sys
+import codecs
 import subprocess
 import threading
 import time
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
+import shlex
+import stat
+import glob
+import fnmatch
+import select
+import tempfile
+from collections import deque
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/var/log/system_manager.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Optional io_uring bindings used to batch the cleanup sweep syscalls
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# tkinter is imported on first GUI use, see _lazy_tk()
+tk = ttk = messagebox = scrolledtext = None
+
+# Configure logging (the log file is skipped when /var/log is not writable)
+LOG_FILE = '/var/log/system_manager.log'
+log_handlers = [logging.StreamHandler(sys.stdout)]
+try:
+    log_handlers.insert(0, logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=3))
+except OSError:
+    pass
+
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+# Callers only enqueue records; a background listener thread does the writes
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(logging.handlers.QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 
+# Read size for /proc files sampled by get_system_info
+PROC_READ_SIZE = 8192
+
+# Cached environment detection results
+ENV_CACHE_FILE = '/var/cache/ltool/env.json'
+
+# Binaries resolved to absolute paths once instead of walking $PATH per command
+BINARIES = (
+    'apt', 'apt-get', 'dnf', 'yum', 'pacman', 'zypper', 'sudo', 'systemctl',
+    'sysctl', 'journalctl', 'ldconfig', 'dpkg', 'updatedb', 'prelink', 'sync'
+)
+
+# Pipe read size and amount of command output kept in memory
+READ_CHUNK_SIZE = 32768
+OUTPUT_LIMIT = 65536
+
+# Bounds for the GUI log widget and the in-memory operations log
+LOG_MAX_LINES = 2000
+OPERATIONS_LOG_LIMIT = 1000
+
+# Kernel parameters applied (and persisted) by the performance boost
+SYSCTL_CONF_FILE = '/etc/sysctl.d/99-ltool.conf'
+BOOST_SYSCTL_SETTINGS = {
+    'vm.swappiness': '10',
+    'vm.vfs_cache_pressure': '50',
+    'net.core.rmem_max': '16777216',
+    'net.core.wmem_max': '16777216'
+}
+
+@dataclass(frozen=True)
+class Sweep:
+    """In-process removal of old files under a root path (glob patterns allowed)"""
+    root: str
+    max_age_days: int
+    pattern: Optional[str] = None
+    use_mtime: bool = False
+    
+    def __str__(self):
+        age = 'mtime' if self.use_mtime else 'atime'
+        name = f" {self.pattern}" if self.pattern else ""
+        return f"sweep {self.root}{name} {age} > {self.max_age_days}d"
+
+@dataclass(frozen=True)
+class Operation:
+    """A maintenance step
+    
+    The command is an argument list or a Sweep run in-process. Consecutive
+    independent operations run concurrently; cacheable housekeeping operations
+    are skipped if they succeeded within RECENT_OP_WINDOW.
+    """
+    command: object
+    description: str
+    independent: bool = False
+    cacheable: bool = False
+
+# Number of removed files between cleanup sweep progress reports
+SWEEP_REPORT_INTERVAL = 500
+
+# Submission queue depth for io_uring cleanup batches
+IO_URING_BATCH = 256
+
+# Cacheable operations that succeeded within this many seconds are not run again
+RECENT_OP_WINDOW = 120
+CACHED_RESULT = "(cached)"
+
+# Maintenance operation tables, keyed by package manager and then by operation
+OPERATIONS = {
+    'apt': {
+        'update': [
+            Operation(['sudo', 'apt', 'update'], "Updating package lists...", cacheable=True),
+            Operation(['sudo', 'apt', 'upgrade', '-y'], "Upgrading packages..."),
+            Operation(['sudo', 'apt', 'dist-upgrade', '-y'], "Distribution upgrade..."),
+            Operation(['sudo', 'apt', 'autoremove', '-y'], "Removing unused packages...", cacheable=True),
+            Operation(['sudo', 'apt', 'autoclean'], "Cleaning package cache...", cacheable=True)
+        ],
+        'fix': [
+            Operation(['sudo', 'apt', 'update', '--fix-missing'], "Fixing missing packages..."),
+            Operation(['sudo', 'apt', '-f', 'install'], "Fixing broken dependencies..."),
+            Operation(['sudo', 'dpkg', '--configure', '-a'], "Configuring packages..."),
+            Operation(['sudo', 'apt', 'check'], "Checking package integrity..."),
+            Operation(['sudo', 'apt', 'autoremove', '-y'], "Removing broken packages...", cacheable=True)
+        ],
+        'cleanup': [
+            Operation(['sudo', 'apt', 'autoremove', '-y'], "Removing unused packages...", cacheable=True),
+            Operation(['sudo', 'apt', 'autoclean'], "Cleaning package cache...", cacheable=True),
+            Operation(['sudo', 'apt', 'clean'], "Deep cleaning cache...")
+        ]
+    },
+    'dnf': {
+        'update': [
+            Operation(['sudo', 'dnf', 'check-update'], "Checking for updates..."),
+            Operation(['sudo', 'dnf', 'upgrade', '-y'], "Upgrading packages..."),
+            Operation(['sudo', 'dnf', 'autoremove', '-y'], "Removing unused packages...", cacheable=True),
+            Operation(['sudo', 'dnf', 'clean', 'all'], "Cleaning package cache...")
+        ],
+        'fix': [
+            Operation(['sudo', 'dnf', 'check'], "Checking system integrity..."),
+            Operation(['sudo', 'dnf', 'distro-sync'], "Synchronizing packages..."),
+            Operation(['sudo', 'dnf', 'autoremove', '-y'], "Removing problematic packages...", cacheable=True)
+        ],
+        'cleanup': [
+            Operation(['sudo', 'dnf', 'autoremove', '-y'], "Removing unused packages...", cacheable=True),
+            Operation(['sudo', 'dnf', 'clean', 'all'], "Cleaning package cache...")
+        ]
+    },
+    'pacman': {
+        'update': [
+            Operation(['sudo', 'pacman', '-Syu', '--noconfirm'], "System update..."),
+            Operation(['sudo', 'pacman', '-Rns', '--noconfirm', '$(pacman -Qtdq)'], "Removing orphans..."),
+            Operation(['sudo', 'pacman', '-Scc', '--noconfirm'], "Cleaning cache...")
+        ],
+        'fix': [
+            Operation(['sudo', 'pacman', '-Dk'], "Checking dependencies..."),
+            Operation(['sudo', 'pacman', '-Syu', '--noconfirm'], "Synchronizing system..."),
+            Operation(['sudo', 'pacman', '-Rns', '--noconfirm', '$(pacman -Qtdq)'], "Removing orphaned packages...")
+        ],
+        'cleanup': [
+            Operation(['sudo', 'pacman', '-Rns', '--noconfirm', '$(pacman -Qtdq)'], "Removing orphaned packages..."),
+            Operation(['sudo', 'pacman', '-Scc', '--noconfirm'], "Cleaning package cache...")
+        ]
+    }
+}
+OPERATIONS['apt-get'] = OPERATIONS['apt']
+OPERATIONS['yum'] = OPERATIONS['dnf']
+
+# Operations shared by every package manager, run after the package operations
+COMMON_OPERATIONS = {
+    'update': [],
+    'fix': [
+        Operation(['sudo', 'journalctl', '--vacuum-time=7d'], "Cleaning system logs...", independent=True, cacheable=True),
+        Operation(['sudo', 'systemctl', 'daemon-reload'], "Reloading systemd...", independent=True),
+        Operation(['sudo', 'ldconfig'], "Updating library cache...", independent=True),
+        Operation(['sudo', 'updatedb'], "Updating locate database...", independent=True)
+    ],
+    'cleanup': [
+        Operation(['sudo', 'journalctl', '--vacuum-time=3d'], "Cleaning old logs...", independent=True, cacheable=True),
+        Operation(Sweep('/tmp', 7), "Cleaning temp files...", independent=True),
+        Operation(Sweep('/var/tmp', 7), "Cleaning var temp...", independent=True),
+        Operation(Sweep('/var/log', 30, '*.log', use_mtime=True), "Cleaning old logs...", independent=True),
+        Operation(Sweep('/home/*/.cache', 7), "Cleaning user caches...", independent=True)
+    ],
+    'boost': [
+        Operation(['sudo', 'sysctl', '-p', SYSCTL_CONF_FILE], "Applying kernel parameters..."),
+        Operation(['sudo', 'systemctl', 'disable', 'bluetooth'], "Disabling bluetooth service..."),
+        Operation(['sudo', 'systemctl', 'mask', 'plymouth-quit-wait.service', 'plymouth-start.service'], "Optimizing boot time..."),
+        Operation(['sudo', 'prelink', '-amR'], "Optimizing binaries..."),
+        Operation(['sudo', 'sync'], "Syncing filesystems...")
+    ]
+}
+
 @dataclass
 class SystemInfo:
     """System information structure"""
@@ -56,102 +238,310 @@ class SystemManager:
             'arch': ['pacman'],
             'opensuse': ['zypper']
         }
-        self.distro = self.detect_distro()
-        self.package_manager = self.get_package_manager()
+        if not self.load_env_cache():
+            self.bin = {name: shutil.which(name) for name in BINARIES}
+            self.distro, self.distro_like = self.detect_distro()
+            self.package_manager = self.get_package_manager()
+            self.save_env_cache()
         logger.info(f"Detected distribution: {self.distro}")
+        
+        # /proc descriptors kept open across system info refreshes
+        self._proc_fds: Dict[str, int] = {}
+        
+        # System information that does not change while running
+        self._static_info = {
+            'os_name': self.read_os_release().get('PRETTY_NAME', 'Unknown'),
+            'kernel_version': os.uname().release
+        }
     
-    def detect_distro(self) -> str:
-        """Detect the Linux distribution"""
+    def os_release_mtime(self) -> Optional[float]:
+        """Get the modification time of /etc/os-release"""
         try:
-            # Check /etc/os-release
-            if os.path.exists('/etc/os-release'):
-                with open('/etc/os-release', 'r') as f:
-                    content = f.read().lower()
-                    if 'ubuntu' in content:
-                        return 'ubuntu'
-                    elif 'debian' in content:
-                        return 'debian'
-                    elif 'fedora' in content:
-                        return 'fedora'
-                    elif 'centos' in content:
-                        return 'centos'
-                    elif 'arch' in content:
-                        return 'arch'
-                    elif 'opensuse' in content:
-                        return 'opensuse'
+            return os.stat('/etc/os-release').st_mtime
+        except OSError:
+            return None
+    
+    def load_env_cache(self) -> bool:
+        """Load cached distro detection if /etc/os-release is unchanged"""
+        try:
+            with open(ENV_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+            if cache.get('os_release_mtime') != self.os_release_mtime():
+                return False
+            self.distro = cache['distro']
+            self.distro_like = tuple(cache['distro_like'])
+            self.package_manager = cache['package_manager']
+            self.bin = cache['bin']
+            return True
+        except (OSError, ValueError, KeyError):
+            return False
+    
+    def save_env_cache(self):
+        """Save distro detection results for the next launch"""
+        cache = {
+            'distro': self.distro,
+            'distro_like': self.distro_like,
+            'package_manager': self.package_manager,
+            'bin': self.bin,
+            'os_release_mtime': self.os_release_mtime()
+        }
+        try:
+            os.makedirs(os.path.dirname(ENV_CACHE_FILE), exist_ok=True)
+            with open(ENV_CACHE_FILE, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.error(f"Error saving environment cache: {e}")
+    
+    def read_os_release(self) -> Dict[str, str]:
+        """Parse /etc/os-release into a key/value dictionary"""
+        fields = {}
+        try:
+            with open('/etc/os-release', 'r') as f:
+                for line in f:
+                    key, sep, value = line.strip().partition('=')
+                    if sep:
+                        fields[key] = value.strip('"\'')
+        except OSError:
+            pass
+        return fields
+    
+    def supported_distro(self, distro_id: str) -> Optional[str]:
+        """Map an os-release ID to a supported distribution, if any"""
+        distro_id = distro_id.lower()
+        if distro_id in self.supported_distros:
+            return distro_id
+        # openSUSE reports opensuse-leap / opensuse-tumbleweed
+        if distro_id.split('-')[0] in self.supported_distros:
+            return distro_id.split('-')[0]
+        return None
+    
+    def detect_distro(self) -> Tuple[str, Tuple[str, ...]]:
+        """Detect the Linux distribution
+        
+        Returns the distribution and the supported distributions it derives
+        from (os-release ID_LIKE), e.g. ('ubuntu', ('ubuntu', 'debian')) for Pop!_OS.
+        """
+        try:
+            fields = self.read_os_release()
+            distro = self.supported_distro(fields.get('ID', ''))
+            like = tuple(filter(None, map(self.supported_distro, fields.get('ID_LIKE', '').split())))
+            if distro is None and like:
+                distro = like[0]
+            if distro is not None:
+                return distro, like
             
             # Fallback methods
             if os.path.exists('/etc/debian_version'):
-                return 'debian'
+                return 'debian', ()
             elif os.path.exists('/etc/redhat-release'):
-                return 'fedora'
+                return 'fedora', ()
             elif os.path.exists('/etc/arch-release'):
-                return 'arch'
+                return 'arch', ()
             
-            return 'unknown'
+            return 'unknown', ()
         except Exception as e:
             logger.error(f"Error detecting distribution: {e}")
-            return 'unknown'
+            return 'unknown', ()
     
     def get_package_manager(self) -> str:
-        """Get the appropriate package manager"""
-        if self.distro in self.supported_distros:
-            for pm in self.supported_distros[self.distro]:
-                if self.command_exists(pm):
+        """Get the appropriate package manager, trying parent distributions too"""
+        for distro in (self.distro,) + self.distro_like:
+            for pm in self.supported_distros.get(distro, []):
+                if self.bin.get(pm):
                     return pm
         return 'apt'  # Default fallback
     
-    def command_exists(self, command: str) -> bool:
-        """Check if a command exists"""
+    def resolve_command(self, command: List[str]) -> List[str]:
+        """Replace the program (and the program run by sudo) with its absolute path"""
+        resolved = list(command)
+        for i, arg in enumerate(resolved[:2]):
+            if not os.path.dirname(arg):
+                if arg not in self.bin:
+                    self.bin[arg] = shutil.which(arg)
+                resolved[i] = self.bin[arg] or arg
+            if os.path.basename(arg) != 'sudo':
+                break
+        return resolved
+    
+    @staticmethod
+    def open_pidfd(pid: int) -> Optional[int]:
+        """Open a pidfd for the process, or None if unsupported (Linux < 5.3)"""
         try:
-            subprocess.run(['which', command], capture_output=True, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            return os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            return None
     
-    def run_command(self, command: List[str], timeout: int = 300) -> Tuple[bool, str]:
-        """Execute a system command with timeout"""
+    def run_command(self, command: List[str], timeout: int = 300,
+                    line_callback=None) -> Tuple[bool, str]:
+        """Execute a system command with timeout, streaming output lines to line_callback
+        
+        Output and process exit are waited on with select() over the stdout
+        pipe and a pidfd, so no thread wakes up until there is something to do.
+        """
         try:
+            command = self.resolve_command(command)
             logger.info(f"Executing command: {' '.join(command)}")
-            result = subprocess.run(
+            # An absolute program path and close_fds=False let Popen use
+            # posix_spawn instead of fork+exec (our descriptors are all CLOEXEC)
+            process = subprocess.Popen(
                 command,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                close_fds=False
             )
-            return True, result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "Command timed out"
-        except subprocess.CalledProcessError as e:
-            return False, f"Command failed: {e.stderr}"
         except Exception as e:
             return False, f"Error: {str(e)}"
+        
+        deadline = time.monotonic() + timeout
+        pidfd = self.open_pidfd(process.pid)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        output = ''
+        pending = ''
+        timed_out = False
+        
+        try:
+            fd = process.stdout.fileno()
+            readers = [fd] if pidfd is None else [fd, pidfd]
+            exited = False
+            while True:
+                if not exited:
+                    ready, _, _ = select.select(readers, [], [], max(deadline - time.monotonic(), 0))
+                    if not ready:
+                        timed_out = True
+                        break
+                    if pidfd in ready:
+                        # Drain what the child left in the pipe without waiting on
+                        # grandchildren that may still hold it open
+                        exited = True
+                        os.set_blocking(fd, False)
+                try:
+                    chunk = os.read(fd, READ_CHUNK_SIZE)
+                except BlockingIOError:
+                    chunk = b''
+                text = decoder.decode(chunk, final=not chunk)
+                # Only the tail of the output is kept in memory
+                output = (output + text)[-OUTPUT_LIMIT:]
+                if line_callback:
+                    pending += text
+                    *lines, pending = pending.split('\n')
+                    if not chunk and pending:
+                        lines.append(pending)
+                    for line in lines:
+                        line_callback(line)
+                if not chunk:
+                    break
+            
+            if not timed_out and not exited:
+                if pidfd is not None:
+                    timed_out = not select.select([pidfd], [], [], max(deadline - time.monotonic(), 0))[0]
+                else:
+                    try:
+                        process.wait(max(deadline - time.monotonic(), 0))
+                    except subprocess.TimeoutExpired:
+                        timed_out = True
+            if timed_out:
+                process.kill()
+            returncode = process.wait()
+        except Exception as e:
+            process.kill()
+            process.wait()
+            return False, f"Error: {str(e)}"
+        finally:
+            process.stdout.close()
+            if pidfd is not None:
+                os.close(pidfd)
+        
+        if timed_out:
+            return False, "Command timed out"
+        if returncode != 0:
+            return False, f"Command failed: {output}"
+        return True, output
+    
+    @staticmethod
+    def format_bytes(size: float) -> str:
+        """Format a byte count in human readable form"""
+        for unit in ['B', 'K', 'M', 'G', 'T']:
+            if size < 1024 or unit == 'T':
+                break
+            size /= 1024
+        return f"{size:.1f}{unit}"
+    
+    @staticmethod
+    def format_uptime(seconds: float) -> str:
+        """Format uptime seconds like `uptime -p`"""
+        minutes = int(seconds) // 60
+        days, minutes = divmod(minutes, 24 * 60)
+        hours, minutes = divmod(minutes, 60)
+        parts = []
+        if days:
+            parts.append(f"{days} day{'s' if days != 1 else ''}")
+        if hours:
+            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+        if minutes or not parts:
+            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+        return "up " + ", ".join(parts)
+    
+    def read_proc(self, name: str) -> bytes:
+        """Read a /proc file with pread on a descriptor kept open between calls"""
+        fd = self._proc_fds.get(name)
+        if fd is None:
+            fd = os.open(f'/proc/{name}', os.O_RDONLY)
+            existing = self._proc_fds.setdefault(name, fd)
+            if existing != fd:
+                os.close(fd)
+                fd = existing
+        return os.pread(fd, PROC_READ_SIZE, 0)
+    
+    @staticmethod
+    def meminfo_field(data: bytes, key: bytes) -> Optional[int]:
+        """Get a /proc/meminfo field in bytes"""
+        start = data.find(key + b':')
+        if start < 0:
+            return None
+        start += len(key) + 1
+        return int(data[start:data.find(b'\n', start)].split()[0]) * 1024
+    
+    def read_cpu_times(self) -> Tuple[int, int]:
+        """Read (idle, total) jiffies from the aggregate cpu line of /proc/stat"""
+        data = self.read_proc('stat')
+        values = [int(v) for v in data[:data.find(b'\n')].split()[1:]]
+        # idle + iowait count as idle time
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        return idle, sum(values)
     
     def get_system_info(self) -> SystemInfo:
         """Get comprehensive system information"""
         try:
-            # OS Name
-            os_name = subprocess.getoutput("lsb_release -d 2>/dev/null | cut -f2 || echo 'Unknown'")
-            
-            # Kernel Version
-            kernel_version = subprocess.getoutput("uname -r")
-            
             # Uptime
-            uptime = subprocess.getoutput("uptime -p 2>/dev/null || uptime")
+            uptime = self.format_uptime(float(self.read_proc('uptime').split()[0]))
             
             # Memory Usage
-            memory_usage = subprocess.getoutput("free -h | grep 'Mem:' | awk '{print $3\"/\"$2}'")
+            meminfo = self.read_proc('meminfo')
+            mem_total = self.meminfo_field(meminfo, b'MemTotal')
+            mem_available = self.meminfo_field(meminfo, b'MemAvailable')
+            if mem_available is None:
+                mem_available = self.meminfo_field(meminfo, b'MemFree')
+            mem_used = mem_total - mem_available
+            memory_usage = f"{self.format_bytes(mem_used)}/{self.format_bytes(mem_total)}"
             
             # Disk Usage
-            disk_usage = subprocess.getoutput("df -h / | tail -1 | awk '{print $3\"/\"$2\" (\"$5\" used)\"}'")
+            st = os.statvfs('/')
+            disk_total = st.f_blocks * st.f_frsize
+            disk_used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            disk_avail = st.f_bavail * st.f_frsize
+            disk_percent = disk_used / (disk_used + disk_avail) * 100 if disk_used + disk_avail else 0
+            disk_usage = f"{self.format_bytes(disk_used)}/{self.format_bytes(disk_total)} ({disk_percent:.0f}% used)"
             
-            # CPU Usage
-            cpu_usage = subprocess.getoutput("top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | sed 's/%us,//' || echo 'N/A'")
+            # CPU Usage (sampled over 100ms)
+            idle_start, total_start = self.read_cpu_times()
+            time.sleep(0.1)
+            idle_end, total_end = self.read_cpu_times()
+            total_delta = total_end - total_start
+            cpu_usage = f"{(1 - (idle_end - idle_start) / total_delta) * 100:.1f}" if total_delta else "N/A"
             
             return SystemInfo(
-                os_name=os_name,
-                kernel_version=kernel_version,
+                **self._static_info,
                 uptime=uptime,
                 memory_usage=memory_usage,
                 disk_usage=disk_usage,
@@ -166,155 +556,339 @@ class MaintenanceOperations:
     
     def __init__(self, system_manager: SystemManager):
         self.sm = system_manager
-        self.operations_log = []
-    
-    def update_system(self, progress_callback=None) -> Tuple[bool, str]:
-        """Update and upgrade the system"""
-        operations = []
+        self.operations_log = deque(maxlen=OPERATIONS_LOG_LIMIT)
         
-        if self.sm.package_manager in ['apt', 'apt-get']:
-            operations = [
-                (['sudo', 'apt', 'update'], "Updating package lists..."),
-                (['sudo', 'apt', 'upgrade', '-y'], "Upgrading packages..."),
-                (['sudo', 'apt', 'dist-upgrade', '-y'], "Distribution upgrade..."),
-                (['sudo', 'apt', 'autoremove', '-y'], "Removing unused packages..."),
-                (['sudo', 'apt', 'autoclean'], "Cleaning package cache...")
-            ]
-        elif self.sm.package_manager in ['dnf', 'yum']:
-            operations = [
-                (['sudo', 'dnf', 'check-update'], "Checking for updates..."),
-                (['sudo', 'dnf', 'upgrade', '-y'], "Upgrading packages..."),
-                (['sudo', 'dnf', 'autoremove', '-y'], "Removing unused packages..."),
-                (['sudo', 'dnf', 'clean', 'all'], "Cleaning package cache...")
-            ]
-        elif self.sm.package_manager == 'pacman':
-            operations = [
-                (['sudo', 'pacman', '-Syu', '--noconfirm'], "System update..."),
-                (['sudo', 'pacman', '-Rns', '--noconfirm', '$(pacman -Qtdq)'], "Removing orphans..."),
-                (['sudo', 'pacman', '-Scc', '--noconfirm'], "Cleaning cache...")
+        # Select this system's operation tables once, with binaries already resolved
+        package_ops = OPERATIONS.get(self.sm.package_manager, {})
+        self._ops = {}
+        for name, common_ops in COMMON_OPERATIONS.items():
+            operations = package_ops.get(name, []) + common_ops
+            self._ops[name] = [
+                op if isinstance(op.command, Sweep) else replace(op, command=self.sm.resolve_command(op.command))
+                for op in operations
             ]
         
-        return self._execute_operations(operations, progress_callback)
+        # Non-cacheable package operations; each run invalidates cached results
+        self._package_changing = {
+            self._operation_key(op.command)
+            for name in COMMON_OPERATIONS
+            for op in self._ops[name][:len(package_ops.get(name, []))]
+            if not op.cacheable
+        }
+        
+        # Files removed by the cleanup sweeps, shared across sweep threads
+        self._sweep_lock = threading.Lock()
+        self.swept_files = 0
+        
+        # Monotonic time of each cacheable operation's last successful run
+        self._recent_ops: Dict[tuple, float] = {}
     
-    def fix_system(self, progress_callback=None) -> Tuple[bool, str]:
+    def update_system(self, progress_callback=None, line_callback=None) -> Tuple[bool, str]:
+        """Update and upgrade the system"""
+        return self._execute_operations(self._ops['update'], progress_callback, line_callback)
+    
+    def fix_system(self, progress_callback=None, line_callback=None) -> Tuple[bool, str]:
         """Fix common system issues"""
+        return self._execute_operations(self._ops['fix'], progress_callback, line_callback)
+    
+    def auto_remove_unused(self, progress_callback=None, line_callback=None) -> Tuple[bool, str]:
+        """Remove unused packages, files, and clean system"""
+        self.swept_files = 0
+        return self._execute_operations(self._ops['cleanup'], progress_callback, line_callback)
+    
+    def full_maintenance(self, progress_callback=None, line_callback=None) -> Tuple[bool, str]:
+        """Update, fix and clean the system, running each distinct operation once"""
+        # The cleanup journal vacuum keeps fewer days, so it supersedes the fix one
+        fix_ops = [op for op in self._ops['fix'] if not self._is_journal_vacuum(op.command)]
         operations = []
+        keys = set()
+        for operation in self._ops['update'] + fix_ops + self._ops['cleanup']:
+            key = self._operation_key(operation.command)
+            if key not in keys:
+                keys.add(key)
+                operations.append(operation)
+        self.swept_files = 0
+        return self._execute_operations(operations, progress_callback, line_callback)
+    
+    def boost_system(self, progress_callback=None, line_callback=None) -> Tuple[bool, str]:
+        """Optimize system performance"""
+        if self._write_sysctl_conf():
+            return self._execute_operations(self._ops['boost'], progress_callback, line_callback)
         
-        if self.sm.package_manager in ['apt', 'apt-get']:
-            operations = [
-                (['sudo', 'apt', 'update', '--fix-missing'], "Fixing missing packages..."),
-                (['sudo', 'apt', '-f', 'install'], "Fixing broken dependencies..."),
-                (['sudo', 'dpkg', '--configure', '-a'], "Configuring packages..."),
-                (['sudo', 'apt', 'check'], "Checking package integrity..."),
-                (['sudo', 'apt', 'autoremove', '-y'], "Removing broken packages...")
-            ]
-        elif self.sm.package_manager in ['dnf', 'yum']:
-            operations = [
-                (['sudo', 'dnf', 'check'], "Checking system integrity..."),
-                (['sudo', 'dnf', 'distro-sync'], "Synchronizing packages..."),
-                (['sudo', 'dnf', 'autoremove', '-y'], "Removing problematic packages...")
-            ]
-        elif self.sm.package_manager == 'pacman':
-            operations = [
-                (['sudo', 'pacman', '-Dk'], "Checking dependencies..."),
-                (['sudo', 'pacman', '-Syu', '--noconfirm'], "Synchronizing system..."),
-                (['sudo', 'pacman', '-Rns', '--noconfirm', '$(pacman -Qtdq)'], "Removing orphaned packages...")
-            ]
+        # Without the drop-in, sysctl -p would only reload stale or missing settings
+        operations = [op for op in self._ops['boost'] if SYSCTL_CONF_FILE not in op.command]
+        success, result = self._execute_operations(operations, progress_callback, line_callback)
+        return success, f"✗ Writing kernel parameters to {SYSCTL_CONF_FILE}\n{result}"
+    
+    def _write_sysctl_conf(self) -> bool:
+        """Write the boost kernel parameters to a sysctl.d drop-in so they persist"""
+        temp_name = None
+        try:
+            conf_dir = os.path.dirname(SYSCTL_CONF_FILE)
+            with tempfile.NamedTemporaryFile('w', dir=conf_dir, delete=False) as f:
+                temp_name = f.name
+                for key, value in BOOST_SYSCTL_SETTINGS.items():
+                    f.write(f"{key} = {value}\n")
+            os.chmod(temp_name, 0o644)
+            os.replace(temp_name, SYSCTL_CONF_FILE)
+            return True
+        except OSError as e:
+            logger.error(f"Error writing {SYSCTL_CONF_FILE}: {e}")
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+            return False
+    
+    def _expand_command_substitution(self, command: List[str]) -> Optional[List[str]]:
+        """Replace $(...) arguments with the output lines of the inner command
         
-        # Common system fixes
-        common_fixes = [
-            (['sudo', 'journalctl', '--vacuum-time=7d'], "Cleaning system logs..."),
-            (['sudo', 'systemctl', 'daemon-reload'], "Reloading systemd..."),
-            (['sudo', 'ldconfig'], "Updating library cache..."),
-            (['sudo', 'updatedb'], "Updating locate database...")
-        ]
+        Returns None when a substitution expands to nothing, meaning the
+        command has no work to do and should be skipped.
+        """
+        expanded = []
+        for arg in command:
+            if arg.startswith('$(') and arg.endswith(')'):
+                # Collect every line; the returned output is truncated to OUTPUT_LIMIT.
+                # A failing inner command (e.g. pacman -Qtdq with no orphans) yields nothing
+                lines = []
+                success, _ = self.sm.run_command(shlex.split(arg[2:-1]), line_callback=lines.append)
+                values = [value for line in lines for value in line.split()] if success else []
+                if not values:
+                    return None
+                expanded.extend(values)
+            else:
+                expanded.append(arg)
+        return expanded
+    
+    @staticmethod
+    def _open_ring():
+        """Create an io_uring for the cleanup sweep, or None to use plain syscalls
         
-        operations.extend(common_fixes)
-        return self._execute_operations(operations, progress_callback)
+        Needs the optional liburing bindings and Linux >= 5.11 (IORING_OP_UNLINKAT).
+        """
+        if liburing is None:
+            return None
+        try:
+            version = tuple(int(part) for part in os.uname().release.split('.')[:2])
+            if version < (5, 11):
+                return None
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(IO_URING_BATCH, ring, 0)
+            return ring
+        except (ValueError, OSError):
+            return None
     
-    def auto_remove_unused(self, progress_callback=None) -> Tuple[bool, str]:
-        """Remove unused packages, files, and clean system"""
-        operations = []
+    def _uring_submit_all(self, ring, count: int, prepare) -> List[int]:
+        """Submit count SQEs (prepared by prepare(sqe, index)) in ring-sized batches
         
-        # Package cleanup
-        if self.sm.package_manager in ['apt', 'apt-get']:
-            operations.extend([
-                (['sudo', 'apt', 'autoremove', '-y'], "Removing unused packages..."),
-                (['sudo', 'apt', 'autoclean'], "Cleaning package cache..."),
-                (['sudo', 'apt', 'clean'], "Deep cleaning cache...")
-            ])
-        elif self.sm.package_manager in ['dnf', 'yum']:
-            operations.extend([
-                (['sudo', 'dnf', 'autoremove', '-y'], "Removing unused packages..."),
-                (['sudo', 'dnf', 'clean', 'all'], "Cleaning package cache...")
-            ])
-        elif self.sm.package_manager == 'pacman':
-            operations.extend([
-                (['sudo', 'pacman', '-Rns', '--noconfirm', '$(pacman -Qtdq)'], "Removing orphaned packages..."),
-                (['sudo', 'pacman', '-Scc', '--noconfirm'], "Cleaning package cache...")
-            ])
-        
-        # System cleanup
-        cleanup_operations = [
-            (['sudo', 'journalctl', '--vacuum-time=3d'], "Cleaning old logs..."),
-            (['sudo', 'find', '/tmp', '-type', 'f', '-atime', '+7', '-delete'], "Cleaning temp files..."),
-            (['sudo', 'find', '/var/tmp', '-type', 'f', '-atime', '+7', '-delete'], "Cleaning var temp..."),
-            (['sudo', 'find', '/var/log', '-name', '*.log', '-type', 'f', '-mtime', '+30', '-delete'], "Cleaning old logs..."),
-            (['sudo', 'find', '/home', '-name', '.cache', '-type', 'd', '-exec', 'rm', '-rf', '{}', '+'], "Cleaning user caches...")
-        ]
+        Returns each completion result, negative errno on failure.
+        """
+        results = [0] * count
+        cqe = liburing.Cqe()
+        for start in range(0, count, IO_URING_BATCH):
+            end = min(start + IO_URING_BATCH, count)
+            for index in range(start, end):
+                sqe = liburing.io_uring_get_sqe(ring)
+                prepare(sqe, index)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            liburing.io_uring_submit_and_wait(ring, end - start)
+            seen = 0
+            for _ in liburing.CqeIter(ring, cqe):
+                entry = cqe[0]
+                try:
+                    results[entry.user_data] = entry.res
+                except OSError as e:
+                    # Recent liburing bindings raise for a negative res instead of
+                    # returning -errno; every CQE must still be counted and advanced
+                    results[entry.user_data] = -e.errno
+                seen += 1
+            liburing.io_uring_cq_advance(ring, seen)
+        return results
+    
+    def _remove_stale_files_uring(self, ring, dir_fd: int, names: List[str],
+                                  cutoff: float, use_mtime: bool) -> int:
+        """Batch statx and unlinkat for the directory's regular files through io_uring"""
+        stats = [liburing.Statx() for _ in names]
+        results = self._uring_submit_all(ring, len(names), lambda sqe, i: liburing.io_uring_prep_statx(
+            sqe, stats[i], names[i], liburing.AT_SYMLINK_NOFOLLOW,
+            liburing.STATX_TYPE | liburing.STATX_ATIME | liburing.STATX_MTIME, dir_fd))
+        stale = [name for name, st, result in zip(names, stats, results)
+                 if result == 0 and st.isreg and (st.mtime if use_mtime else st.atime) < cutoff]
+        results = self._uring_submit_all(ring, len(stale), lambda sqe, i: liburing.io_uring_prep_unlink(
+            sqe, stale[i], 0, dir_fd))
+        return sum(1 for result in results if result == 0)
+    
+    def _remove_stale_files(self, dir_fd: int, names: List[str], cutoff: float, use_mtime: bool) -> int:
+        """Stat and unlink the directory's regular files one syscall at a time"""
+        removed = 0
+        for name in names:
+            try:
+                st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+                if stat.S_ISREG(st.st_mode) and (st.st_mtime if use_mtime else st.st_atime) < cutoff:
+                    os.unlink(name, dir_fd=dir_fd)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+    
+    def _sweep_old_files(self, root: str, max_age_days: int, pattern: Optional[str] = None,
+                         use_mtime: bool = False, line_callback=None) -> Tuple[bool, str]:
+        """Delete files under root whose atime (or mtime) is older than max_age_days
+        
+        Runs as root over user-writable trees, so symlinks are never followed:
+        a symlinked root is skipped and the tree is walked by descriptor.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        ring = self._open_ring()
         
-        operations.extend(cleanup_operations)
-        return self._execute_operations(operations, progress_callback)
+        try:
+            for top in glob.glob(root):
+                try:
+                    # e.g. a user's ~/.cache pointing at /etc
+                    if not stat.S_ISDIR(os.lstat(top).st_mode):
+                        continue
+                except OSError:
+                    continue
+                
+                for _, _, files, dir_fd in os.fwalk(top, follow_symlinks=False):
+                    names = [name for name in files if not pattern or fnmatch.fnmatch(name, pattern)]
+                    if not names:
+                        continue
+                    try:
+                        if ring is not None:
+                            count = self._remove_stale_files_uring(ring, dir_fd, names, cutoff, use_mtime)
+                        else:
+                            count = self._remove_stale_files(dir_fd, names, cutoff, use_mtime)
+                    except OSError:
+                        continue
+                    
+                    removed += count
+                    with self._sweep_lock:
+                        previous = self.swept_files
+                        self.swept_files += count
+                        total = self.swept_files
+                    if line_callback and total // SWEEP_REPORT_INTERVAL > previous // SWEEP_REPORT_INTERVAL:
+                        line_callback(f"Cleanup: {total} old files removed")
+        finally:
+            if ring is not None:
+                liburing.io_uring_queue_exit(ring)
+        
+        return True, f"Removed {removed} files from {root}"
     
-    def boost_system(self, progress_callback=None) -> Tuple[bool, str]:
-        """Optimize system performance"""
-        operations = [
-            (['sudo', 'sysctl', '-w', 'vm.swappiness=10'], "Optimizing swap usage..."),
-            (['sudo', 'sysctl', '-w', 'vm.vfs_cache_pressure=50'], "Optimizing cache pressure..."),
-            (['sudo', 'sysctl', '-w', 'net.core.rmem_max=16777216'], "Optimizing network buffers..."),
-            (['sudo', 'sysctl', '-w', 'net.core.wmem_max=16777216'], "Optimizing network buffers..."),
-            (['sudo', 'systemctl', 'disable', 'bluetooth'], "Disabling bluetooth service..."),
-            (['sudo', 'systemctl', 'mask', 'plymouth-quit-wait.service'], "Optimizing boot time..."),
-            (['sudo', 'systemctl', 'mask', 'plymouth-start.service'], "Optimizing boot time..."),
-            (['sudo', 'prelink', '-amR'], "Optimizing binaries..."),
-            (['sudo', 'sync'], "Syncing filesystems..."),
-            (['sudo', 'sysctl', '-p'], "Applying kernel parameters...")
-        ]
+    @staticmethod
+    def _is_journal_vacuum(command) -> bool:
+        """Whether an operation command vacuums the systemd journal"""
+        return not isinstance(command, Sweep) and any(arg.startswith('--vacuum-') for arg in command)
+    
+    @staticmethod
+    def _operation_key(command) -> tuple:
+        """Hashable identity of an operation command"""
+        return (command,) if isinstance(command, Sweep) else tuple(command)
+    
+    def _run_operation(self, operation: Operation, line_callback=None) -> Tuple[bool, str]:
+        """Run a single operation, skipping cacheable ones that recently succeeded"""
+        command = operation.command
+        key = self._operation_key(command)
+        last_run = self._recent_ops.get(key) if operation.cacheable else None
+        if last_run is not None and time.monotonic() - last_run < RECENT_OP_WINDOW:
+            return True, CACHED_RESULT
         
-        return self._execute_operations(operations, progress_callback)
+        if isinstance(command, Sweep):
+            success, output = self._sweep_old_files(command.root, command.max_age_days, command.pattern,
+                                                    command.use_mtime, line_callback)
+        else:
+            expanded = self._expand_command_substitution(command)
+            if expanded is None:
+                success, output = True, "Nothing to do"
+            else:
+                success, output = self.sm.run_command(expanded, line_callback=line_callback)
+        
+        if key in self._package_changing:
+            self._recent_ops.clear()
+        elif success and operation.cacheable:
+            self._recent_ops[key] = time.monotonic()
+        return success, output
+    
+    def _next_batch(self, operations: List[Operation], start: int) -> List[Operation]:
+        """Collect the run of consecutive independent operations starting at start"""
+        batch = [operations[start]]
+        if operations[start].independent:
+            for operation in operations[start + 1:]:
+                if not operation.independent:
+                    break
+                batch.append(operation)
+        return batch
     
-    def _execute_operations(self, operations: List[Tuple[List[str], str]], progress_callback=None) -> Tuple[bool, str]:
-        """Execute a list of operations"""
+    def _execute_operations(self, operations: List[Operation], progress_callback=None,
+                            line_callback=None) -> Tuple[bool, str]:
+        """Execute a list of operations
+        
+        Consecutive independent operations run concurrently.
+        """
         results = []
         total_ops = len(operations)
+        i = 0
         
-        for i, (command, description) in enumerate(operations):
-            if progress_callback:
-                progress = (i + 1) / total_ops * 100
-                progress_callback(progress, description)
+        # Wall-clock time is formatted once per run; entries record monotonic offsets
+        started_at = datetime.now().isoformat()
+        started = time.monotonic()
+        
+        while i < total_ops:
+            batch = self._next_batch(operations, i)
             
-            success, output = self.sm.run_command(command)
+            if progress_callback:
+                for j, operation in enumerate(batch):
+                    progress = (i + j + 1) / total_ops * 100
+                    progress_callback(progress, operation.description)
             
-            log_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'command': ' '.join(command),
-                'description': description,
-                'success': success,
-                'output': output[:200] + '...' if len(output) > 200 else output
-            }
+            if len(batch) == 1:
+                outcomes = [self._run_operation(batch[0], line_callback)]
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(batch))) as executor:
+                    outcomes = list(executor.map(
+                        lambda operation: self._run_operation(operation, line_callback),
+                        batch))
             
-            self.operations_log.append(log_entry)
-            results.append(f"{'✓' if success else '✗'} {description}")
+            for operation, (success, output) in zip(batch, outcomes):
+                command, description = operation.command, operation.description
+                
+                log_entry = {
+                    'started_at': started_at,
+                    'elapsed': round(time.monotonic() - started, 3),
+                    'command': str(command) if isinstance(command, Sweep) else ' '.join(command),
+                    'description': description,
+                    'success': success,
+                    'output': output[:200] + '...' if len(output) > 200 else output
+                }
+                
+                self.operations_log.append(log_entry)
+                cached = f" {CACHED_RESULT}" if output == CACHED_RESULT else ""
+                results.append(f"{'✓' if success else '✗'} {description}{cached}")
+                
+                if not success:
+                    logger.error(f"Operation failed: {description} - {output}")
             
-            if not success:
-                logger.error(f"Operation failed: {description} - {output}")
+            i += len(batch)
         
+        logger.info(f"Operations started {started_at} finished {datetime.now().isoformat()}")
         return True, '\n'.join(results)
 
+def _lazy_tk():
+    """Import the tkinter stack on first use"""
+    global tk, ttk, messagebox, scrolledtext
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as tk_ttk, messagebox as tk_messagebox, scrolledtext as tk_scrolledtext
+        tk, ttk, messagebox, scrolledtext = tkinter, tk_ttk, tk_messagebox, tk_scrolledtext
+
 class SystemManagerGUI:
     """GUI interface for the system manager"""
     
     def __init__(self):
+        _lazy_tk()
         self.root = tk.Tk()
         self.root.title("Linux System Manager - Professional Maintenance Tool")
         self.root.geometry("900x700")
@@ -382,8 +956,9 @@ class SystemManagerGUI:
             ttk.Label(info_frame, text=f"{label}:", font=("Arial", 9, "bold")).grid(
                 row=row, column=col*2, sticky=tk.W, padx=(0, 5), pady=2)
             
-            self.info_labels[key] = ttk.Label(info_frame, text="Loading...", font=("Arial", 9))
-            self.info_labels[key].grid(row=row, column=col*2+1, sticky=tk.W, padx=(0, 20), pady=2)
+            self.info_labels[key] = tk.StringVar(value="Loading...")
+            ttk.Label(info_frame, textvariable=self.info_labels[key], font=("Arial", 9)).grid(
+                row=row, column=col*2+1, sticky=tk.W, padx=(0, 20), pady=2)
     
     def setup_operations(self, parent):
         """Setup operation buttons"""
@@ -401,7 +976,8 @@ class SystemManagerGUI:
             ("🔄 Update & Upgrade", self.update_system, "#3498db"),
             ("🔧 Fix System Issues", self.fix_system, "#e74c3c"),
             ("🗑️ Remove Unused Files", self.auto_remove, "#f39c12"),
-            ("🚀 Boost Performance", self.boost_system, "#2ecc71")
+            ("🚀 Boost Performance", self.boost_system, "#2ecc71"),
+            ("🧰 Full Maintenance", self.full_maintenance, "#9b59b6")
         ]
         
         for i, (text, command, color) in enumerate(buttons):
@@ -443,18 +1019,24 @@ class SystemManagerGUI:
         # Clear log button
         clear_btn = ttk.Button(log_frame, text="Clear Log", command=self.clear_log)
         clear_btn.pack(pady=(10, 0))
+        
+        # Messages are queued by worker threads and flushed in batches
+        self.pending_log = deque()
+        self.log_clock = (0, "")
+        self.log_flush_lock = threading.Lock()
+        self.log_flush_scheduled = False
     
     def update_system_info(self):
         """Update system information display"""
         def update_info():
             info = self.system_manager.get_system_info()
             
-            self.info_labels["os_name"].config(text=info.os_name)
-            self.info_labels["kernel_version"].config(text=info.kernel_version)
-            self.info_labels["uptime"].config(text=info.uptime)
-            self.info_labels["memory_usage"].config(text=info.memory_usage)
-            self.info_labels["disk_usage"].config(text=info.disk_usage)
-            self.info_labels["cpu_usage"].config(text=f"{info.cpu_usage}%")
+            self.info_labels["os_name"].set(info.os_name)
+            self.info_labels["kernel_version"].set(info.kernel_version)
+            self.info_labels["uptime"].set(info.uptime)
+            self.info_labels["memory_usage"].set(info.memory_usage)
+            self.info_labels["disk_usage"].set(info.disk_usage)
+            self.info_labels["cpu_usage"].set(f"{info.cpu_usage}%")
         
         threading.Thread(target=update_info, daemon=True).start()
     
@@ -466,13 +1048,35 @@ class SystemManagerGUI:
     
     def log_message(self, message):
         """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        # Reformat the clock only when the second changes
+        now = int(time.time())
+        if now != self.log_clock[0]:
+            self.log_clock = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        self.pending_log.append(f"[{self.log_clock[1]}] {message}\n")
+        # Schedule a flush only while messages are arriving
+        with self.log_flush_lock:
+            if not self.log_flush_scheduled:
+                self.log_flush_scheduled = True
+                self.root.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Insert queued log messages in a single batch"""
+        with self.log_flush_lock:
+            self.log_flush_scheduled = False
+        if self.pending_log:
+            messages = []
+            while self.pending_log:
+                messages.append(self.pending_log.popleft())
+            self.log_text.insert(tk.END, ''.join(messages))
+            # Drop the oldest half once the widget exceeds its line budget
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES // 2}.0')
+            self.log_text.see(tk.END)
     
     def clear_log(self):
         """Clear the log display"""
+        self.pending_log.clear()
         self.log_text.delete(1.0, tk.END)
     
     def run_operation(self, operation_func, operation_name):
@@ -482,7 +1086,7 @@ class SystemManagerGUI:
                 self.log_message(f"Starting {operation_name}...")
                 self.progress_var.set(0)
                 
-                success, result = operation_func(self.update_progress)
+                success, result = operation_func(self.update_progress, self.log_message)
                 
                 if success:
                     self.log_message(f"✓ {operation_name} completed successfully")
@@ -515,6 +1119,10 @@ class SystemManagerGUI:
         """Remove unused files"""
         self.run_operation(self.maintenance_ops.auto_remove_unused, "Cleanup")
     
+    def full_maintenance(self):
+        """Update, fix and clean the system in one pass"""
+        self.run_operation(self.maintenance_ops.full_maintenance, "Full Maintenance")
+    
     def boost_system(self):
         """Boost system performance"""
         if messagebox.askyesno("Performance Boost", 